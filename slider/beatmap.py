@@ -1,9 +1,12 @@
+from bisect import bisect_left
+from copy import copy
 from datetime import timedelta
 from enum import unique, IntEnum
-from functools import partial
+from functools import lru_cache, partial
 import inspect
 from itertools import chain, islice, cycle
 import operator as op
+import os
 import re
 from zipfile import ZipFile
 
@@ -313,6 +316,33 @@ class HitObject:
 
         return type(self)(**kwargs)
 
+    def _with_position(self, position):
+        """Copy this ``HitObject`` to a new position.
+
+        Parameters
+        ----------
+        position : Position
+            The position of the copy.
+
+        Returns
+        -------
+        moved : HitObject
+            The moved hit object.
+
+        Notes
+        -----
+        Values cached by :class:`~slider.utils.lazyval` are not copied
+        because they may depend on the position.
+        """
+        obj = copy(self)
+        cls = type(self)
+        attrs = vars(obj)
+        for name in list(attrs):
+            if isinstance(getattr(cls, name, None), lazyval):
+                del attrs[name]
+        obj.position = position
+        return obj
+
     def _get_type_bits(self):
         # bit numbers below are zero indexed.
 
@@ -728,7 +758,8 @@ class Slider(HitObject):
 
         See also https://github.com/ppy/osu/blob/5a1940facf2649bc6b2892965c27b8
         c62a41988f/osu.Game/Rulesets/Objects/SliderEventGenerator.cs#L71-L93"""
-        tick_points = self.tick_points
+        # copy the cached ticks before replacing the last one
+        tick_points = list(self.tick_points)
         # curve() takes in a percentage of how far along we want the point.
         # Take away the offset from the total length of the slider to get
         # the percentage of the slider we want the point at.
@@ -797,9 +828,8 @@ class Slider(HitObject):
 
         points = [position]
         for point in raw_points:
-            try:
-                x, y = point.split(':')
-            except ValueError:
+            x, sep, y = point.partition(':')
+            if not sep:
                 raise ValueError(
                     f'expected points in the form x:y, got {point!r}',
                 )
@@ -1638,6 +1668,13 @@ class _DifficultyHitObject:
         return distance ** 0.99
 
 
+@lru_cache(256)
+def _from_path_cached(cls, path, mtime_ns):
+    # ``mtime_ns`` is only part of the cache key so that a file which changes
+    # on disk is parsed again
+    return cls.from_path(path)
+
+
 class Beatmap:
     """A beatmap for osu! standard.
 
@@ -1792,6 +1829,8 @@ class Beatmap:
         self._hit_objects = hit_objects
         # cache hit object stacking at different ar and cs values
         self._hit_objects_with_stacking = {}
+        # cache the results of ``hit_objects`` for each set of arguments
+        self._hit_objects_cache = {}
 
         # cache the stars with different mod combinations
         self._stars_cache = {}
@@ -2014,7 +2053,26 @@ class Beatmap:
         hit_objects : list[HitObject]
             The objects with their effective positions and timings given the
             parameter set.
+
+        Notes
+        -----
+        The result is cached for each set of parameters, so repeated calls
+        return the same hit objects.
         """
+        key = (
+            circles,
+            sliders,
+            spinners,
+            stacking,
+            easy,
+            hard_rock,
+            double_time,
+            half_time,
+        )
+        try:
+            return self._hit_objects_cache[key]
+        except KeyError:
+            pass
 
         hit_objects = self._hit_objects
 
@@ -2022,30 +2080,31 @@ class Beatmap:
             hit_objects = [ob.hard_rock for ob in hit_objects]
 
         if stacking:
-            ar = self.ar(easy=easy, hard_rock=hard_rock)
-            cs = self.cs(easy=easy, hard_rock=hard_rock)
-            # stacking changes with ar and cs (or equivalently EZ/HR), so only
-            # cache up to ar and cs
-            stacking_key = (ar, cs)
-
-            if self.format_version >= 6:
-                resolve_stacking_method = self._resolve_stacking
-            else:
-                resolve_stacking_method = self._resolve_stacking_old
-
-            # use cache if available
-            if stacking_key in self._hit_objects_with_stacking:
-                hit_objects = self._hit_objects_with_stacking[stacking_key]
-            else:
-                hit_objects = resolve_stacking_method(hit_objects, ar, cs)
-                # cache stacking calculation
-                self._hit_objects_with_stacking[stacking_key] = hit_objects
+            hit_objects, _ = self._stacked_hit_objects(
+                hit_objects,
+                easy=easy,
+                hard_rock=hard_rock,
+            )
 
         if double_time:
             hit_objects = [ob.double_time for ob in hit_objects]
         elif half_time:
             hit_objects = [ob.half_time for ob in hit_objects]
 
+        keep_classes = self._hit_object_classes(
+            circles=circles,
+            sliders=sliders,
+            spinners=spinners,
+        )
+        hit_objects = self._hit_objects_cache[key] = tuple(
+            ob for ob in hit_objects if isinstance(ob, keep_classes)
+        )
+        return hit_objects
+
+    @staticmethod
+    def _hit_object_classes(*, circles, sliders, spinners):
+        """The hit object types to keep for the given filter flags.
+        """
         keep_classes = []
         if spinners:
             keep_classes.append(Spinner)
@@ -2053,9 +2112,146 @@ class Beatmap:
             keep_classes.append(Circle)
         if sliders:
             keep_classes.append(Slider)
+        return tuple(keep_classes)
+
+    def _stacked_hit_objects(self, hit_objects, *, easy, hard_rock):
+        """Resolve stacking for the given hit objects.
+
+        Parameters
+        ----------
+        hit_objects : list[HitObject]
+            The objects to resolve stacking for, with hard rock already
+            applied if needed.
+        easy : bool
+            Resolve stacking with easy enabled.
+        hard_rock : bool
+            Resolve stacking with hard rock enabled.
+
+        Returns
+        -------
+        hit_objects : list[HitObject]
+            The objects with their stacked positions.
+        stack_heights : np.ndarray[int32]
+            The stack height of each hit object.
+        """
+        ar = self.ar(easy=easy, hard_rock=hard_rock)
+        cs = self.cs(easy=easy, hard_rock=hard_rock)
+        # stacking changes with ar and cs (or equivalently EZ/HR), so only
+        # cache up to ar and cs
+        stacking_key = (ar, cs)
+
+        # use cache if available
+        try:
+            return self._hit_objects_with_stacking[stacking_key]
+        except KeyError:
+            pass
+
+        if self.format_version >= 6:
+            resolve_stacking_method = self._resolve_stacking
+        else:
+            resolve_stacking_method = self._resolve_stacking_old
+
+        # cache stacking calculation
+        stacked = self._hit_objects_with_stacking[stacking_key] = (
+            resolve_stacking_method(hit_objects, ar, cs)
+        )
+        return stacked
+
+    def stack_heights(self,
+                      *,
+                      circles=True,
+                      sliders=True,
+                      spinners=True,
+                      easy=False,
+                      hard_rock=False):
+        """Retrieve the stack height of each hit object as an array.
+
+        Parameters
+        ----------
+        circles : bool, optional
+            If circles should be included.
+        sliders : bool, optional
+            If sliders should be included.
+        spinners : bool, optional
+            If spinners should be included.
+        easy : bool, optional
+            Get the stack heights with easy enabled.
+        hard_rock : bool, optional
+            Get the stack heights with hard rock enabled.
+
+        Returns
+        -------
+        stack_heights : np.ndarray[int32]
+            The number of stack offsets applied to each hit object, in the same
+            order as :meth:`hit_objects` with ``stacking=True``. Negative
+            heights move the object down and right instead of up and left.
+        """
+        hit_objects = self._hit_objects
+        if hard_rock:
+            hit_objects = [ob.hard_rock for ob in hit_objects]
+
+        hit_objects, stack_heights = self._stacked_hit_objects(
+            hit_objects,
+            easy=easy,
+            hard_rock=hard_rock,
+        )
+        keep_classes = self._hit_object_classes(
+            circles=circles,
+            sliders=sliders,
+            spinners=spinners,
+        )
+        mask = np.fromiter(
+            (isinstance(ob, keep_classes) for ob in hit_objects),
+            dtype=bool,
+            count=len(hit_objects),
+        )
+        return stack_heights[mask]
+
+    def hit_object_positions(self,
+                             *,
+                             circles=True,
+                             sliders=True,
+                             spinners=True,
+                             stacking=True,
+                             easy=False,
+                             hard_rock=False):
+        """Retrieve the positions of the hit objects as an array.
+
+        Parameters
+        ----------
+        circles : bool, optional
+            If circles should be included.
+        sliders : bool, optional
+            If sliders should be included.
+        spinners : bool, optional
+            If spinners should be included.
+        stacking : bool, optional
+            If stacking should be calculated.
+        easy : bool, optional
+            Get the effective position of the hit objects with easy enabled.
+        hard_rock : bool, optional
+            Get the effective position of the hit objects with hard rock
+            enabled.
 
-        return tuple(ob for ob in hit_objects if
-                     isinstance(ob, tuple(keep_classes)))
+        Returns
+        -------
+        positions : np.ndarray[float]
+            An array of shape ``(len(hit_objects), 2)`` holding the x and y
+            coordinate of each hit object, in the same order as
+            :meth:`hit_objects`.
+        """
+        hit_objects = self.hit_objects(
+            circles=circles,
+            sliders=sliders,
+            spinners=spinners,
+            stacking=stacking,
+            easy=easy,
+            hard_rock=hard_rock,
+        )
+        return np.array(
+            [ob.position for ob in hit_objects],
+            dtype=np.float64,
+        ).reshape(-1, 2)
 
     def _resolve_stacking(self, hit_objects, ar, cs):
         """
@@ -2076,6 +2272,8 @@ class Beatmap:
         hit_objects : list[HitObject]
             The objects with their new positions, as adjusted by account for
             stacking.
+        stack_heights : np.ndarray[int32]
+            The stack height of each hit object.
         """
         stack_threshold = ar_to_ms(ar) * self.stack_leniency
         stack_threshold = timedelta(milliseconds=stack_threshold)
@@ -2154,17 +2352,7 @@ class Beatmap:
         # reverse list again so it's normal
         hit_objects = list(reversed(hit_objects))
 
-        # apply stacking
-        radius = circle_radius(cs)
-        stack_offset = radius / 10
-
-        for hit_object in hit_objects:
-            offset = stack_offset * stack_height[hit_object]
-            p = hit_object.position
-            p_new = Position(p.x - offset, p.y - offset)
-            hit_object.position = p_new
-
-        return hit_objects
+        return self._apply_stacking(hit_objects, stack_height, cs)
 
     def _resolve_stacking_old(self, hit_objects, ar, cs):
         """
@@ -2185,6 +2373,8 @@ class Beatmap:
         hit_objects : list[HitObject]
             The objects with their new positions, as adjusted by account for
             stacking.
+        stack_heights : np.ndarray[int32]
+            The stack height of each hit object.
         """
         stack_threshold = ar_to_ms(ar) * self.stack_leniency
         stack_threshold = timedelta(milliseconds=stack_threshold)
@@ -2226,22 +2416,53 @@ class Beatmap:
                     else:
                         start_time = ob_j.time
 
-        # apply stacking
+        return self._apply_stacking(hit_objects, stack_height, cs)
+
+    @staticmethod
+    def _apply_stacking(hit_objects, stack_height, cs):
+        """Offset the hit objects by their stack heights.
+
+        Parameters
+        ----------
+        hit_objects : list[HitObject]
+            The objects to offset.
+        stack_height : dict[HitObject, int]
+            The stack height of each hit object.
+        cs : float
+            The circle size to resolve stacking for.
+
+        Returns
+        -------
+        hit_objects : list[HitObject]
+            Copies of the objects moved to their stacked positions.
+        stack_heights : np.ndarray[int32]
+            The stack height of each hit object.
+        """
+        stack_heights = np.fromiter(
+            (stack_height[hit_object] for hit_object in hit_objects),
+            dtype=np.int32,
+            count=len(hit_objects),
+        )
+
         radius = circle_radius(cs)
         stack_offset = radius / 10
 
-        for hit_object in hit_objects:
-            offset = stack_offset * stack_height[hit_object]
+        stacked_hit_objects = []
+        for hit_object, height in zip(hit_objects, stack_heights.tolist()):
+            offset = stack_offset * height
             p = hit_object.position
-            p_new = Position(p.x - offset, p.y - offset)
-            hit_object.position = p_new
+            stacked_hit_objects.append(
+                hit_object._with_position(
+                    Position(p.x - offset, p.y - offset),
+                ),
+            )
 
-        return hit_objects
+        return stacked_hit_objects, stack_heights
 
     @lazyval
     def _hit_object_times(self):
         """a (sorted) list of hitobject time's, so they can be searched with
-        ``np.searchsorted``
+        ``bisect``
         """
         return [hitobj.time for hitobj in self._hit_objects]
 
@@ -2269,7 +2490,9 @@ class Beatmap:
         if len(self._hit_objects) == 1:
             return self._hit_objects[0]
 
-        i = np.searchsorted(self._hit_object_times, t)
+        # ``bisect`` searches the cached list directly; ``np.searchsorted``
+        # would first copy all of the times into an object array
+        i = bisect_left(self._hit_object_times, t)
         # if ``t`` is after the last hitobject, an index of
         # len(self._hit_objects) will be returned. The last hitobject will
         # always be the closest hitobject in this case.
@@ -2286,7 +2509,7 @@ class Beatmap:
         dist1 = abs(hitobj1.time - t)
         dist2 = abs(hitobj2.time - t)
 
-        hitobj1_closer = dist1 <= dist2 if side == "left" else dist1 < dist1
+        hitobj1_closer = dist1 <= dist2 if side == "left" else dist1 < dist2
 
         if hitobj1_closer:
             return hitobj1
@@ -2353,6 +2576,36 @@ class Beatmap:
         with open(path, encoding='utf-8-sig') as file:
             return cls.from_file(file)
 
+    @classmethod
+    def from_path_cached(cls, path):
+        """Read in a ``Beatmap`` object from a file on disk, reusing the
+        result of an earlier call for the same unchanged file.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            The path to the file to read from.
+
+        Returns
+        -------
+        beatmap : Beatmap
+            The parsed beatmap object.
+
+        Raises
+        ------
+        ValueError
+            Raised when the file cannot be parsed as a ``.osu`` file.
+
+        Notes
+        -----
+        Beatmaps are cached by resolved path and modification time, so a file
+        is parsed again after it changes on disk. The returned beatmap is
+        shared with every other caller that reads the same file and must not be
+        mutated; use :meth:`from_path` to get a private copy.
+        """
+        path = os.path.realpath(path)
+        return _from_path_cached(cls, path, os.stat(path).st_mtime_ns)
+
     @classmethod
     def from_osz_file(cls, file):
         """Read a beatmap collection from a ``.osz`` file on disk.
@@ -2474,12 +2727,8 @@ class Beatmap:
                 # build a dict from the ``Key: Value`` line format.
                 mapping = {}
                 for line in group_buffer:
-                    split = line.split(':', 1)
-                    try:
-                        key, value = split
-                    except ValueError:
-                        key = split[0]
-                        value = ''
+                    # lines without a ``:`` are keys with an empty value
+                    key, _, value = line.partition(':')
 
                     # throw away whitespace
                     mapping[key.strip()] = value.strip()
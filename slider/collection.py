@@ -1,4 +1,4 @@
-from .replay import consume_int, consume_string
+from .utils import mapped_file, read_int, read_string
 
 
 class CollectionDB:
@@ -27,8 +27,10 @@ class CollectionDB:
         path : str or pathlib.Path
             The path to the file to read from.
         """
-        with open(path, 'rb') as f:
-            return cls.from_file(f)
+        # map the file instead of reading it so that large databases are
+        # paged in by the OS as they are parsed
+        with mapped_file(path) as data:
+            return cls.parse(data)
 
     @classmethod
     def from_file(cls, file):
@@ -47,16 +49,17 @@ class CollectionDB:
 
         Parameters
         ----------
-        data : bytes
+        data : bytes-like
             The data from a ``collection.db`` file.
         """
-        buffer = bytearray(data)
+        buffer = memoryview(data)
 
-        version = consume_int(buffer)
-        num_collections = consume_int(buffer)
+        version, offset = read_int(buffer, 0)
+        num_collections, offset = read_int(buffer, offset)
         collections = []
         for i in range(num_collections):
-            collections.append(Collection.parse(buffer))
+            collection, offset = Collection.parse(buffer, offset)
+            collections.append(collection)
 
         return cls(version, num_collections, collections)
 
@@ -80,18 +83,28 @@ class Collection:
         self.md5_hashes = md5_hashes
 
     @classmethod
-    def parse(cls, buffer):
+    def parse(cls, buffer, offset):
         """Parse an osu! collection.
 
         Parameters
         ----------
-        buffer : bytearray
+        buffer : memoryview
             Buffer passed in from parsing ``CollectionDB``
+        offset : int
+            The offset of the collection in ``buffer``.
+
+        Returns
+        -------
+        collection : Collection
+            The parsed collection.
+        offset : int
+            The offset of the end of the collection in ``buffer``.
         """
-        name = consume_string(buffer)
-        num_beatmaps = consume_int(buffer)
+        name, offset = read_string(buffer, offset)
+        num_beatmaps, offset = read_int(buffer, offset)
         md5_hashes = []
         for i in range(num_beatmaps):
-            md5_hashes.append(consume_string(buffer))
+            md5_hash, offset = read_string(buffer, offset)
+            md5_hashes.append(md5_hash)
 
-        return cls(name, num_beatmaps, md5_hashes)
+        return cls(name, num_beatmaps, md5_hashes), offset
@@ -3,14 +3,25 @@ import math
 from itertools import accumulate, chain
 
 import numpy as np
-try:  # SciPy >= 0.19
-    from scipy.special import comb
-except ImportError:
-    from scipy.misc import comb
 
 from .abc import ABCMeta, abstractmethod
 from .position import Position
-from .utils import lazyval
+from .utils import lazyval, memoize
+
+
+@memoize
+def _comb():
+    """Import :func:`scipy.special.comb`.
+
+    ``scipy.special`` accounts for about half of the time it takes to import
+    slider, so it is only imported once a bezier curve is evaluated.
+    """
+    try:  # SciPy >= 0.19
+        from scipy.special import comb
+    except ImportError:
+        from scipy.misc import comb
+
+    return comb
 
 
 class Curve(metaclass=ABCMeta):
@@ -147,7 +158,7 @@ class Bezier(Curve):
         ixs = np.arange(n + 1)
         return np.sum(
             (
-                comb(n, ixs) *
+                _comb()(n, ixs) *
                 (1 - t) ** (n - ixs) *
                 t ** ixs
             )[:, np.newaxis] *
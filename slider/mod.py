@@ -1,4 +1,5 @@
 from collections import namedtuple
+from functools import lru_cache
 
 from .bit_enum import BitEnum
 
@@ -133,6 +134,8 @@ def ms_to_ar(ms):
     return ar
 
 
+# beatmaps only use a handful of distinct circle sizes
+@lru_cache(32)
 def circle_radius(cs):
     """Compute the ``CS`` attribute into a circle radius in osu! pixels.
 
@@ -17,12 +17,35 @@ class Position(namedtuple('Position', 'x y')):
     The visible region of the osu! standard playfield is [0, 512] by [0, 384].
     Positions may fall outside of this range for slider curve control points.
     """
+    __slots__ = ()
+
     x_max = 512
     y_max = 384
 
     def __eq__(self, other):
         return self.x == other.x and self.y == other.y
 
+    def close_to(self, other, tolerance):
+        """Check if another position is near this one.
+
+        Parameters
+        ----------
+        other : Position or Point
+            The position to compare to.
+        tolerance : int or float
+            The largest allowed difference along each axis.
+
+        Returns
+        -------
+        close : bool
+            Whether both coordinates of ``other`` are within ``tolerance`` of
+            this position.
+        """
+        return (
+            abs(self.x - other.x) <= tolerance and
+            abs(self.y - other.y) <= tolerance
+        )
+
 
 class Point(namedtuple('Point', 'x y offset')):
     """A position and time on the osu! screen.
@@ -41,6 +64,7 @@ class Point(namedtuple('Point', 'x y offset')):
     The visible region of the osu! standard playfield is [0, 512] by [0, 384].
     Positions may fall outside of this range for slider curve control points.
     """
+    __slots__ = ()
 
 
 def distance(start, end):
@@ -1,16 +1,23 @@
 import bisect
+from concurrent.futures import ProcessPoolExecutor
 import datetime
 from enum import unique
+from functools import partial
 import os
 import lzma
+import re
+import struct
+import warnings
+
+import numpy as np
 
 from .beatmap import Circle, Slider, Spinner
 from .bit_enum import BitEnum
 from .game_mode import GameMode
 from .mod import Mod, od_to_ms, circle_radius
 from .position import Position
-from .utils import (accuracy, lazyval, orange, consume_byte, consume_short,
-                    consume_int, consume_string, consume_datetime)
+from .utils import (accuracy, datetime_from_ticks, lazyval, mapped_file,
+                    orange, read_int, read_long, read_string)
 
 
 @unique
@@ -23,13 +30,81 @@ class ActionBitMask(BitEnum):
     k2 = 10
 
 
+# the action flags for every value of the low four bits of an action mask,
+# in the order (m1, m2, k1, k2)
+_action_flags = np.array([
+    [bool(mask & bit) for bit in (ActionBitMask.m1,
+                                  ActionBitMask.m2,
+                                  ActionBitMask.k1,
+                                  ActionBitMask.k2)]
+    for mask in range(16)
+])
+
+
+_empty_records = re.compile(rb',{2,}')
+_pipe = ord('|')
+
+
+def _parse_records(data, fields, name):
+    """Parse a comma separated list of records of ``fields`` pipe separated
+    numbers.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded records. Empty records are skipped.
+    fields : int
+        The number of numbers in each record.
+    name : str
+        The name of the data for error messages.
+
+    Returns
+    -------
+    records : np.ndarray[float64]
+        An array of shape ``(len(records), fields)``.
+
+    Raises
+    ------
+    ValueError
+        Raised when a record does not have exactly ``fields`` numbers.
+    """
+    data = _empty_records.sub(b',', data).strip(b',')
+    if not data:
+        return np.empty((0, fields))
+
+    # check the shape of every record before the separators are flattened
+    # together
+    chars = np.frombuffer(data + b',', dtype=np.uint8)
+    separators = chars[(chars == _pipe) | (chars == ord(','))]
+    if len(separators) % fields:
+        raise ValueError(f'malformed {name}')
+    separators = separators.reshape(-1, fields)
+    if ((separators[:, :-1] != _pipe).any() or
+            (separators[:, -1] == _pipe).any()):
+        raise ValueError(f'malformed {name}')
+
+    with warnings.catch_warnings():
+        # older versions of numpy stop at the first bad number with only a
+        # DeprecationWarning
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(data.replace(b'|', b','), sep=',')
+        except (ValueError, DeprecationWarning):
+            raise ValueError(f'malformed {name}') from None
+
+    if len(values) != separators.size:
+        raise ValueError(f'malformed {name}')
+    return values.reshape(-1, fields)
+
+
 class Action:
     """A user action.
 
     Parameters
     ----------
-    offset : timedelta
-        The offset since the beginning of the song.
+    offset : timedelta or int
+        The offset since the beginning of the song. Integers are interpreted
+        as milliseconds.
     position : Position
         The position of the cursor.
     key1 : bool
@@ -41,14 +116,33 @@ class Action:
     mouse2 : bool
         is the second mouse button pressed?
     """
+    __slots__ = (
+        'offset_ms',
+        'position',
+        'key1',
+        'key2',
+        'mouse1',
+        'mouse2',
+    )
+
     def __init__(self, offset, position, key1, key2, mouse1, mouse2):
-        self.offset = offset
+        if isinstance(offset, datetime.timedelta):
+            offset = offset / _one_ms
+        # the offset is stored in milliseconds so that ``Replay.hits`` can do
+        # its arithmetic on plain numbers instead of ``timedelta`` objects
+        self.offset_ms = offset
         self.position = position
         self.key1 = key1
         self.key2 = key2
         self.mouse1 = mouse1
         self.mouse2 = mouse2
 
+    @property
+    def offset(self):
+        """The offset since the beginning of the song.
+        """
+        return datetime.timedelta(milliseconds=self.offset_ms)
+
     @property
     def action_bitmask(self):
         """Get the action bitmask from an action.
@@ -74,50 +168,271 @@ class Action:
                 f"{' + '.join(actions) or 'No Keypresses'}>")
 
 
-def _consume_life_bar_graph(buffer):
-    life_bar_graph_raw = consume_string(buffer)
-    return [
-        (datetime.timedelta(milliseconds=int(offset)), float(value))
-        for offset, value in (
-            pair.split('|') for pair in life_bar_graph_raw.split(',') if pair
+class ActionArray:
+    """A sequence of user actions stored as columns.
+
+    Parameters
+    ----------
+    offset_ms : np.ndarray[int64]
+        The offset of each action since the beginning of the song in
+        milliseconds.
+    x : np.ndarray[float64]
+        The x coordinate of the cursor for each action.
+    y : np.ndarray[float64]
+        The y coordinate of the cursor for each action.
+    key1 : np.ndarray[bool]
+        Is the first keyboard key pressed?
+    key2 : np.ndarray[bool]
+        Is the second keyboard key pressed?
+    mouse1 : np.ndarray[bool]
+        Is the first mouse button pressed?
+    mouse2 : np.ndarray[bool]
+        Is the second mouse button pressed?
+
+    Notes
+    -----
+    Indexing or iterating an ``ActionArray`` produces :class:`Action`
+    objects, which are only created when requested. Slicing produces a new
+    ``ActionArray`` which shares its columns with this one.
+    """
+    def __init__(self, offset_ms, x, y, key1, key2, mouse1, mouse2):
+        self.offset_ms = offset_ms
+        self.x = x
+        self.y = y
+        self.key1 = key1
+        self.key2 = key2
+        self.mouse1 = mouse1
+        self.mouse2 = mouse2
+
+    @classmethod
+    def parse(cls, data):
+        """Parse the decompressed action data from an ``.osr`` file.
+
+        Parameters
+        ----------
+        data : bytes
+            The decompressed action data. This is a comma separated list of
+            ``offset|x|y|mask`` actions where ``offset`` is relative to the
+            previous action.
+
+        Returns
+        -------
+        actions : ActionArray
+            The parsed actions.
+
+        Raises
+        ------
+        ValueError
+            Raised when ``data`` is not a list of actions.
+        """
+        values = _parse_records(data, 4, 'action data')
+        flags = _action_flags[values[:, 3].astype(np.int64) & 0xf].T
+        return cls(
+            np.cumsum(values[:, 0].astype(np.int64)),
+            values[:, 1],
+            values[:, 2],
+            *np.ascontiguousarray(flags),
+        )
+
+    @lazyval
+    def pressed(self):
+        """Whether any key or mouse button is held down for each action.
+        """
+        return self.key1 | self.key2 | self.mouse1 | self.mouse2
+
+    def __len__(self):
+        return len(self.offset_ms)
+
+    def __getitem__(self, ix):
+        if isinstance(ix, slice):
+            return type(self)(
+                self.offset_ms[ix],
+                self.x[ix],
+                self.y[ix],
+                self.key1[ix],
+                self.key2[ix],
+                self.mouse1[ix],
+                self.mouse2[ix],
+            )
+
+        return Action(
+            int(self.offset_ms[ix]),
+            Position(float(self.x[ix]), float(self.y[ix])),
+            bool(self.key1[ix]),
+            bool(self.key2[ix]),
+            bool(self.mouse1[ix]),
+            bool(self.mouse2[ix]),
+        )
+
+    def __iter__(self):
+        columns = (
+            self.offset_ms.tolist(),
+            self.x.tolist(),
+            self.y.tolist(),
+            self.key1.tolist(),
+            self.key2.tolist(),
+            self.mouse1.tolist(),
+            self.mouse2.tolist(),
+        )
+        for offset, x, y, key1, key2, mouse1, mouse2 in zip(*columns):
+            yield Action(offset, Position(x, y), key1, key2, mouse1, mouse2)
+
+    def __repr__(self):
+        return f'<{type(self).__qualname__}: {len(self)} actions>'
+
+
+class LifeBarGraph:
+    """The value of the life bar over the course of a replay.
+
+    Parameters
+    ----------
+    raw : str
+        The encoded graph from an ``.osr`` file. This is a comma separated
+        list of ``offset|value`` pairs.
+
+    Notes
+    -----
+    The graph is not decoded until it is first used because most consumers of
+    a replay never look at it.
+
+    The decoded graph is stored as two arrays, :attr:`offsets` and
+    :attr:`values`. Indexing or iterating a ``LifeBarGraph`` produces
+    ``(timedelta, float)`` pairs in sorted order. The values are in the range
+    [0, 1].
+    """
+    def __init__(self, raw):
+        self.raw = raw
+
+    @lazyval
+    def _decoded(self):
+        data = _parse_records(
+            self.raw.encode('utf-8'),
+            2,
+            f'life bar graph: {self.raw!r}',
         )
-    ]
-
-
-def _consume_actions(buffer):
-    compressed_byte_count = consume_int(buffer)
-    compressed_data = buffer[:compressed_byte_count]
-    del buffer[:compressed_byte_count]
-    decompressed_data = lzma.decompress(compressed_data)
-
-    out = []
-    offset = 0
-    for raw_action in decompressed_data.split(b','):
-        if not raw_action:
-            continue
-        raw_offset, x, y, raw_action_mask = raw_action.split(b'|')
-        action_mask = ActionBitMask.unpack(int(raw_action_mask))
-        offset += int(raw_offset)
-        out.append(Action(
-            datetime.timedelta(milliseconds=offset),
-            Position(float(x), float(y)),
-            action_mask['m1'],
-            action_mask['m2'],
-            action_mask['k1'],
-            action_mask['k2'],
-        ))
-    return out
-
-
-def _within(p1, p2, d):
-    """Determines whether 2 points are within a distance of each other
+        offsets = data[:, 0].astype(np.int64).astype('timedelta64[ms]')
+        values = np.ascontiguousarray(data[:, 1])
+        return offsets, values
+
+    @property
+    def offsets(self):
+        """The time of each point as a ``timedelta64[ms]`` array.
+        """
+        return self._decoded[0]
+
+    @property
+    def values(self):
+        """The value of the life bar at each point as a ``float64`` array.
+        """
+        return self._decoded[1]
+
+    @lazyval
+    def pairs(self):
+        """The graph as a list of ``(timedelta, float)`` pairs.
+        """
+        return list(zip(self.offsets.tolist(), self.values.tolist()))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, ix):
+        return self.pairs[ix]
+
+    def __iter__(self):
+        return iter(self.pairs)
+
+    def __repr__(self):
+        return f'<{type(self).__qualname__}: {len(self)} points>'
+
+
+def _read_life_bar_graph(buffer, offset):
+    raw, offset = read_string(buffer, offset)
+    return LifeBarGraph(raw or ''), offset
+
+
+def _read_actions(buffer, offset):
+    compressed_byte_count, offset = read_int(buffer, offset)
+    end = offset + compressed_byte_count
+    decompressed_data = lzma.decompress(buffer[offset:end])
+    return ActionArray.parse(decompressed_data), end
+
+
+# the fixed width fields at the start of the replay: mode and version
+_mode_and_version = struct.Struct('<BI')
+# the fixed width fields between the replay md5 and the life bar graph:
+# count_300, count_100, count_50, count_geki, count_katu, count_miss, score,
+# max_combo, full_combo, and mod_mask
+_counts_and_mods = struct.Struct('<HHHHHHIHBI')
+
+
+def _read_header(buffer, offset):
+    """Read the fields of a replay which come before the life bar graph.
+
+    Parameters
+    ----------
+    buffer : memoryview
+        The replay data.
+    offset : int
+        The offset of the start of the replay.
+
+    Returns
+    -------
+    header : tuple
+        The mode, version, beatmap md5, player name, replay md5, the six hit
+        counts, score, max combo, full combo, and mod mask in the order they
+        are passed to :class:`~slider.replay.Replay`.
+    offset : int
+        The offset of the life bar graph.
+    """
+    mode, version = _mode_and_version.unpack_from(buffer, offset)
+    offset += _mode_and_version.size
+    beatmap_md5, offset = read_string(buffer, offset)
+    player_name, offset = read_string(buffer, offset)
+    replay_md5, offset = read_string(buffer, offset)
+    (count_300,
+     count_100,
+     count_50,
+     count_geki,
+     count_katu,
+     count_miss,
+     score,
+     max_combo,
+     full_combo,
+     mod_mask) = _counts_and_mods.unpack_from(buffer, offset)
+    offset += _counts_and_mods.size
+    return (
+        GameMode(mode),
+        version,
+        beatmap_md5,
+        player_name,
+        replay_md5,
+        count_300,
+        count_100,
+        count_50,
+        count_geki,
+        count_katu,
+        count_miss,
+        score,
+        max_combo,
+        bool(full_combo),
+        mod_mask,
+    ), offset
+
+
+_one_ms = datetime.timedelta(milliseconds=1)
+
+
+def _within(p, x, y, d):
+    """Determines whether a point is within a distance of a position
 
     Parameters
     ---------
-    p1 : Position
-        The first point
-    p2 : Position
-        The second point
+    p : Position
+        The position
+    x : float
+        The x coordinate of the point
+    y : float
+        The y coordinate of the point
     d : int or float
         The distance
 
@@ -126,48 +441,64 @@ def _within(p1, p2, d):
     bool
         Whether the distance between the points is less than d
     """
-    return (p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2 < d ** 2
+    return (p.x - x) ** 2 + (p.y - y) ** 2 < d ** 2
 
 
-def _pressed(datum):
-    return datum.key1 or datum.key2 or datum.mouse1 or datum.mouse2
+# the codes stored in ``Replay._hit_categories``
+_HIT_300 = 0
+_HIT_100 = 1
+_HIT_50 = 2
+_HIT_MISS = 3
 
 
-def _process_circle(obj, rdatum, hw, scores):
-    out_by = abs(rdatum.offset - obj.time)
-    if out_by < datetime.timedelta(milliseconds=hw.hit_300):
-        scores["300s"].append(obj)
-    elif out_by < datetime.timedelta(milliseconds=hw.hit_100):
-        scores["100s"].append(obj)
+def _process_circle(ix, obj_time, offset_ms, hw, categories):
+    out_by = abs(offset_ms - obj_time)
+    if out_by < hw.hit_300:
+        categories[ix] = _HIT_300
+    elif out_by < hw.hit_100:
+        categories[ix] = _HIT_100
     else:
         # must be within the 50 hit window or we wouldn't be here
-        scores["50s"].append(obj)
+        categories[ix] = _HIT_50
 
 
-def _process_slider(obj, rdata, head_hit, rad, scores):
+def _process_slider(ix,
+                    obj,
+                    obj_time,
+                    columns,
+                    start,
+                    stop,
+                    head_hit,
+                    rad,
+                    categories,
+                    slider_breaks):
+    offsets, xs, ys, pressed = columns
     t_changes = []
     t_changes_append = t_changes.append
-    duration = obj.end_time - obj.time
+    duration = obj.end_time / _one_ms - obj_time
 
     if head_hit:
-        t_changes_append((rdata[0].offset - obj.time) / duration)
+        t_changes_append((offsets[start] - obj_time) / duration)
         on = True
     else:
-        scores["slider_breaks"].append(obj)
+        slider_breaks[ix] = True
         on = False
 
-    for datum in rdata:
-        t = (datum.offset - obj.time) / duration
+    for offset_ms, x, y, datum_pressed in zip(offsets[start:stop],
+                                              xs[start:stop],
+                                              ys[start:stop],
+                                              pressed[start:stop]):
+        t = (offset_ms - obj_time) / duration
         if 0 <= t <= 1:
             nearest_pos = obj.curve(t)
             if (on and
-                not (_pressed(datum)
-                     and _within(nearest_pos, datum.position, rad * 2.4))):
+                not (datum_pressed
+                     and _within(nearest_pos, x, y, rad * 2.4))):
                 t_changes_append(t)
                 on = False
             elif (not on and
-                  (_pressed(datum) and
-                   _within(nearest_pos, datum.position, rad))):
+                  (datum_pressed and
+                   _within(nearest_pos, x, y, rad))):
                 t_changes_append(t)
                 on = True
 
@@ -184,19 +515,231 @@ def _process_slider(obj, rdata, head_hit, rad, scores):
                     # held close enough to last tick
                     continue
                 # end tick doesn't cause sliderbreak
-            elif obj not in scores["slider_breaks"]:
-                scores["slider_breaks"].append(obj)
+            else:
+                slider_breaks[ix] = True
             missed_points += 1
 
     if missed_points == obj.ticks:
         # all ticks and head missed -> miss
-        scores["misses"].append(obj)
+        categories[ix] = _HIT_MISS
     elif missed_points > obj.ticks / 2:
-        scores["50s"].append(obj)
+        categories[ix] = _HIT_50
     elif missed_points > 0:
-        scores["100s"].append(obj)
+        categories[ix] = _HIT_100
     else:
-        scores["300s"].append(obj)
+        categories[ix] = _HIT_300
+
+
+def _beatmap_source(library, client):
+    """Check the sources passed to find the beatmap for a replay.
+
+    Parameters
+    ----------
+    library : Library or None
+        The library of beatmaps.
+    client : Client or None
+        The client used to find the beatmap.
+
+    Returns
+    -------
+    library : Library
+        The library to look beatmaps up in.
+
+    Raises
+    ------
+    ValueError
+        Raised when not exactly one of ``library`` or ``client`` is passed.
+    """
+    if library is None and client is None:
+        raise ValueError(
+            'one of library or client must be passed if you wish the'
+            ' beatmap to be retrieved',
+        )
+
+    if client is not None:
+        if library is not None:
+            raise ValueError(
+                'only one of library or client can be passed'
+            )
+        library = client.library
+
+    return library
+
+
+def _retrieve_beatmap(beatmap_md5, library, client, save):
+    """Find the beatmap with the given md5, falling back to the client if it
+    is not in the library.
+    """
+    try:
+        return library.lookup_by_md5(beatmap_md5)
+    except KeyError:
+        if client is None:
+            raise
+        return client.beatmap(
+            beatmap_md5=beatmap_md5,
+        ).beatmap(save=save)
+
+
+def _read_summary(path):
+    """Read the fields of a replay which are stored in a
+    :class:`~slider.replay.ReplayTable`.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The path to the ``.osr`` file.
+
+    Returns
+    -------
+    summary : tuple
+        The fields of the replay in the order of the
+        :class:`~slider.replay.ReplayTable` columns.
+
+    Notes
+    -----
+    Only the header, life bar graph, and timestamp are read; the actions are
+    never decompressed.
+    """
+    with mapped_file(path) as data, memoryview(data) as buffer:
+        (mode,
+         _,
+         beatmap_md5,
+         player_name,
+         _,
+         count_300,
+         count_100,
+         count_50,
+         _,
+         _,
+         count_miss,
+         score,
+         max_combo,
+         _,
+         mod_mask), offset = _read_header(buffer, 0)
+        _, offset = read_string(buffer, offset)
+        timestamp_ticks, offset = read_long(buffer, offset)
+    return (
+        mode,
+        beatmap_md5,
+        player_name,
+        count_300,
+        count_100,
+        count_50,
+        count_miss,
+        score,
+        max_combo,
+        mod_mask,
+        timestamp_ticks,
+    )
+
+
+class ReplayTable:
+    """The summary fields of many replays stored as columns.
+
+    Parameters
+    ----------
+    mode : np.ndarray[int]
+        The game mode of each replay.
+    beatmap_md5 : np.ndarray[str]
+        The md5 hash of the beatmap played in each replay.
+    player_name : np.ndarray[str]
+        The name of the player who recorded each replay.
+    count_300 : np.ndarray[int]
+        The number of 300's hit in each replay.
+    count_100 : np.ndarray[int]
+        The number of 100's hit in each replay.
+    count_50 : np.ndarray[int]
+        The number of 50's hit in each replay.
+    count_miss : np.ndarray[int]
+        The number of misses in each replay.
+    score : np.ndarray[int]
+        The score of each replay.
+    max_combo : np.ndarray[int]
+        The largest combo achieved in each replay.
+    mod_mask : np.ndarray[int]
+        The mods used in each replay as a bitmask of
+        :class:`~slider.mod.Mod` values.
+    timestamp_ticks : np.ndarray[int]
+        When each replay was created, as the number of 100 nanosecond ticks
+        since 0001-01-01.
+
+    Notes
+    -----
+    A ``ReplayTable`` is built with
+    :meth:`~slider.replay.Replay.bulk_from_directory`. It is meant for
+    analysing many replays at once where building full
+    :class:`~slider.replay.Replay` objects would be wasteful.
+    """
+    _columns = (
+        ('mode', np.int64),
+        ('beatmap_md5', object),
+        ('player_name', object),
+        ('count_300', np.int64),
+        ('count_100', np.int64),
+        ('count_50', np.int64),
+        ('count_miss', np.int64),
+        ('score', np.int64),
+        ('max_combo', np.int64),
+        ('mod_mask', np.int64),
+        ('timestamp_ticks', np.int64),
+    )
+
+    def __init__(self,
+                 mode,
+                 beatmap_md5,
+                 player_name,
+                 count_300,
+                 count_100,
+                 count_50,
+                 count_miss,
+                 score,
+                 max_combo,
+                 mod_mask,
+                 timestamp_ticks):
+        self.mode = mode
+        self.beatmap_md5 = beatmap_md5
+        self.player_name = player_name
+        self.count_300 = count_300
+        self.count_100 = count_100
+        self.count_50 = count_50
+        self.count_miss = count_miss
+        self.score = score
+        self.max_combo = max_combo
+        self.mod_mask = mod_mask
+        self.timestamp_ticks = timestamp_ticks
+
+    @classmethod
+    def _from_rows(cls, rows):
+        """Build a table from the tuples returned by ``_read_summary``.
+        """
+        columns = []
+        for ix, (_, dtype) in enumerate(cls._columns):
+            column = np.empty(len(rows), dtype=dtype)
+            column[:] = [row[ix] for row in rows]
+            columns.append(column)
+
+        return cls(*columns)
+
+    @lazyval
+    def accuracy(self):
+        """The accuracy achieved in each replay in the range [0, 1].
+
+        Replays which are not osu!standard have an accuracy of nan.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = accuracy(
+                self.count_300,
+                self.count_100,
+                self.count_50,
+                self.count_miss,
+            )
+        return np.where(self.mode == GameMode.standard, values, np.nan)
+
+    def __len__(self):
+        return len(self.mode)
+
+    def __repr__(self):
+        return f'<{type(self).__qualname__}: {len(self)} replays>'
 
 
 class Replay:
@@ -236,76 +779,47 @@ class Replay:
         The largest combo achieved in this replay.
     full_combo : bool
         Did the player earn a max combo in this replay?
-    no_fail : bool
-        Was the no_fail mod used?
-    easy : bool
-        Was the easy mod used?
-    no_video : bool
-        Was the no_video mod used?
-    hidden : bool
-        Was the hidden mod used?
-    hard_rock : hard_rock
-        Was the hard_rock mod used?
-    sudden_death : bool
-        Was the sudden_death mod used?
-    double_time : bool
-        Was the double_time mod used?
-    relax : bool
-        Was the relax mod used?
-    half_time : bool
-        Was the half_time mod used?
-    nightcore : bool
-        Was the nightcore mod used?
-    flashlight : bool
-        Was the flashlight mod used?
-    autoplay : bool
-        Was the autoplay mod used?
-    spun_out : bool
-        Was the spun_out mod used?
-    auto_pilot : bool
-        Was the auto_pilot mod used?
-    perfect : bool
-        Was the perfect mod used?
-    key4 : bool
-        Was the key4 mod used?
-    key5 : bool
-        Was the key5 mod used?
-    key6 : bool
-        Was the key6 mod used?
-    key7 : bool
-        Was the key7 mod used?
-    key8 : bool
-        Was the key8 mod used?
-    fade_in : bool
-        Was the fade_in mod used?
-    random : bool
-        Was the random mod used?
-    cinema : bool
-        Was the cinema mod used?
-    target_practice : bool
-        Was the target_practice mod used?
-    key9 : bool
-        Was the key9 mod used?
-    coop : bool
-        Was the coop mod used?
-    key1 : bool
-        Was the key1 mod used?
-    key3 : bool
-        Was the key3 mod used?
-    key2 : bool
-        Was the key2 mod used?
-    scoreV2 : bool
-        Was the scoreV2 mod used?
-    life_bar_graph : list[timedelta, float]
-        A list of time points paired with the value of the life bar at that
-        time. These appear in sorted order. The values are in the range [0, 1].
-    timestamp : datetime
-        When this replay was created.
-    actions : list[Action]
-        A sorted list of all of the actions recorded from the player.
+    mod_mask : int
+        The mods used in this replay as a bitmask of :class:`~slider.mod.Mod`
+        values. Each mod is also available as a boolean attribute, for
+        example ``replay.hidden``.
+    life_bar_graph : LifeBarGraph or list[timedelta, float]
+        A sequence of time points paired with the value of the life bar at
+        that time. These appear in sorted order. The values are in the range
+        [0, 1].
+    timestamp_ticks : int
+        When this replay was created, as the number of 100 nanosecond ticks
+        since 0001-01-01. This is exposed as a datetime through
+        :attr:`timestamp`.
+    actions : ActionArray
+        A sorted sequence of all of the actions recorded from the player.
     beatmap : Beatmap or None
         The beatmap played in this replay if known, otherwise None.
     """
+    __slots__ = (
+        'mode',
+        'version',
+        'beatmap_md5',
+        'player_name',
+        'replay_md5',
+        'count_300',
+        'count_100',
+        'count_50',
+        'count_geki',
+        'count_katu',
+        'count_miss',
+        'score',
+        'max_combo',
+        'full_combo',
+        'mod_mask',
+        'life_bar_graph',
+        'timestamp_ticks',
+        'actions',
+        'beatmap',
+        # ``lazyval`` caches its results in the instance ``__dict__``
+        '__dict__',
+    )
+
     def __init__(self,
                  mode,
                  version,
@@ -321,38 +835,9 @@ class Replay:
                  score,
                  max_combo,
                  full_combo,
-                 no_fail,
-                 easy,
-                 no_video,
-                 hidden,
-                 hard_rock,
-                 sudden_death,
-                 double_time,
-                 relax,
-                 half_time,
-                 nightcore,
-                 flashlight,
-                 autoplay,
-                 spun_out,
-                 auto_pilot,
-                 perfect,
-                 key4,
-                 key5,
-                 key6,
-                 key7,
-                 key8,
-                 fade_in,
-                 random,
-                 cinema,
-                 target_practice,
-                 key9,
-                 coop,
-                 key1,
-                 key3,
-                 key2,
-                 scoreV2,
+                 mod_mask,
                  life_bar_graph,
-                 timestamp,
+                 timestamp_ticks,
                  actions,
                  beatmap):
         self.mode = mode
@@ -369,41 +854,73 @@ class Replay:
         self.score = score
         self.max_combo = max_combo
         self.full_combo = full_combo
-        self.no_fail = no_fail
-        self.easy = easy
-        self.no_video = no_video
-        self.hidden = hidden
-        self.hard_rock = hard_rock
-        self.sudden_death = sudden_death
-        self.double_time = double_time
-        self.relax = relax
-        self.half_time = half_time
-        self.nightcore = nightcore
-        self.flashlight = flashlight
-        self.autoplay = autoplay
-        self.spun_out = spun_out
-        self.auto_pilot = auto_pilot
-        self.perfect = perfect
-        self.key4 = key4
-        self.key5 = key5
-        self.key6 = key6
-        self.key7 = key7
-        self.key8 = key8
-        self.fade_in = fade_in
-        self.random = random
-        self.cinema = cinema
-        self.target_practice = target_practice
-        self.key9 = key9
-        self.coop = coop
-        self.key1 = key1
-        self.key3 = key3
-        self.key2 = key2
-        self.scoreV2 = scoreV2
+        self.mod_mask = mod_mask
         self.life_bar_graph = life_bar_graph
-        self.timestamp = timestamp
+        self.timestamp_ticks = timestamp_ticks
         self.actions = actions
         self.beatmap = beatmap
 
+    def _mod_flag(mod, name):
+        """Create a property for whether a mod was used in this replay.
+
+        Parameters
+        ----------
+        mod : Mod
+            The mod to check for.
+        name : str
+            The name of the attribute.
+
+        Returns
+        -------
+        flag : property
+            A property which reads the mod out of ``mod_mask``.
+        """
+        def get(self):
+            return bool(self.mod_mask & mod)
+
+        get.__name__ = name
+        get.__doc__ = f'Was the {name} mod used?'
+        return property(get)
+
+    no_fail = _mod_flag(Mod.no_fail, 'no_fail')
+    easy = _mod_flag(Mod.easy, 'easy')
+    no_video = _mod_flag(Mod.no_video, 'no_video')
+    hidden = _mod_flag(Mod.hidden, 'hidden')
+    hard_rock = _mod_flag(Mod.hard_rock, 'hard_rock')
+    sudden_death = _mod_flag(Mod.sudden_death, 'sudden_death')
+    double_time = _mod_flag(Mod.double_time, 'double_time')
+    relax = _mod_flag(Mod.relax, 'relax')
+    half_time = _mod_flag(Mod.half_time, 'half_time')
+    nightcore = _mod_flag(Mod.nightcore, 'nightcore')
+    flashlight = _mod_flag(Mod.flashlight, 'flashlight')
+    autoplay = _mod_flag(Mod.autoplay, 'autoplay')
+    spun_out = _mod_flag(Mod.spun_out, 'spun_out')
+    auto_pilot = _mod_flag(Mod.auto_pilot, 'auto_pilot')
+    perfect = _mod_flag(Mod.perfect, 'perfect')
+    key4 = _mod_flag(Mod.key4, 'key4')
+    key5 = _mod_flag(Mod.key5, 'key5')
+    key6 = _mod_flag(Mod.key6, 'key6')
+    key7 = _mod_flag(Mod.key7, 'key7')
+    key8 = _mod_flag(Mod.key8, 'key8')
+    fade_in = _mod_flag(Mod.fade_in, 'fade_in')
+    random = _mod_flag(Mod.random, 'random')
+    cinema = _mod_flag(Mod.cinema, 'cinema')
+    target_practice = _mod_flag(Mod.target_practice, 'target_practice')
+    key9 = _mod_flag(Mod.key9, 'key9')
+    coop = _mod_flag(Mod.coop, 'coop')
+    key1 = _mod_flag(Mod.key1, 'key1')
+    key3 = _mod_flag(Mod.key3, 'key3')
+    key2 = _mod_flag(Mod.key2, 'key2')
+    scoreV2 = _mod_flag(Mod.scoreV2, 'scoreV2')
+
+    del _mod_flag
+
+    @lazyval
+    def timestamp(self):
+        """When this replay was created.
+        """
+        return datetime_from_ticks(self.timestamp_ticks)
+
     @lazyval
     def accuracy(self):
         """The accuracy achieved in the replay in the range [0, 1].
@@ -480,9 +997,11 @@ class Replay:
         ValueError
             Raised when the file cannot be parsed as an ``.osr`` file.
         """
-        with open(path, 'rb') as f:
-            return cls.from_file(
-                f,
+        # map the file instead of reading it so that the parser can walk the
+        # pages directly without copying the whole replay
+        with mapped_file(path) as data:
+            return cls.parse(
+                data,
                 library=library,
                 client=client,
                 save=save,
@@ -496,7 +1015,8 @@ class Replay:
                        library=None,
                        client=None,
                        save=False,
-                       retrieve_beatmap=True):
+                       retrieve_beatmap=True,
+                       max_workers=1):
         """Read in a list of ``Replay`` objects from a directory of ``.osr``
         files.
 
@@ -513,6 +1033,10 @@ class Replay:
             saved to disk?
         retrieve_beatmap : bool, optional
             Whether to retrieve the beatmap the replay is for.
+        max_workers : int or None, optional
+            The number of processes to parse the replays with. If ``None``,
+            use one per CPU. By default the replays are parsed in this
+            process.
 
         Returns
         -------
@@ -523,18 +1047,79 @@ class Replay:
         ------
         ValueError
             Raised when any file cannot be parsed as an ``.osr`` file.
+
+        Notes
+        -----
+        The replays are parsed before any beatmaps are retrieved. Each
+        distinct beatmap is only looked up once, even when it has to be
+        downloaded with the client, and is shared by all of the replays of
+        it. When ``max_workers`` is not 1, only the parsing is done in the
+        worker processes so that the library and client do not need to be
+        sent to the workers.
         """
-        return [
-            cls.from_path(
-                p,
-                library=library,
-                client=client,
-                save=save,
-                retrieve_beatmap=retrieve_beatmap,
-            )
+        if retrieve_beatmap:
+            library = _beatmap_source(library, client)
+
+        paths = [p.path for p in os.scandir(path) if p.name.endswith('.osr')]
+        if max_workers == 1:
+            replays = [
+                cls.from_path(p, retrieve_beatmap=False) for p in paths
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers) as executor:
+                replays = list(executor.map(
+                    partial(cls.from_path, retrieve_beatmap=False),
+                    paths,
+                    chunksize=16,
+                ))
+
+        if retrieve_beatmap:
+            beatmaps = {}
+            for replay in replays:
+                beatmap_md5 = replay.beatmap_md5
+                try:
+                    beatmap = beatmaps[beatmap_md5]
+                except KeyError:
+                    beatmap = beatmaps[beatmap_md5] = _retrieve_beatmap(
+                        beatmap_md5,
+                        library,
+                        client,
+                        save,
+                    )
+                replay.beatmap = beatmap
+
+        return replays
+
+    @classmethod
+    def bulk_from_directory(cls, path):
+        """Read the summary fields of a directory of ``.osr`` files into a
+        :class:`~slider.replay.ReplayTable`.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            The path to the directory to read from.
+
+        Returns
+        -------
+        table : ReplayTable
+            The hit counts, score, mods, and timestamp of each replay.
+
+        Raises
+        ------
+        ValueError
+            Raised when any file cannot be parsed as an ``.osr`` file.
+
+        Notes
+        -----
+        Only the start of each file is read; the actions are never
+        decompressed and no beatmaps are retrieved.
+        """
+        return ReplayTable._from_rows([
+            _read_summary(p.path)
             for p in os.scandir(path)
             if p.name.endswith('.osr')
-        ]
+        ])
 
     @classmethod
     def from_file(cls,
@@ -590,7 +1175,7 @@ class Replay:
 
         Parameters
         ----------
-        data : bytes
+        data : bytes-like
             The data from an ``.osr`` file.
         library : Library, optional
             The library of beatmaps.
@@ -613,133 +1198,139 @@ class Replay:
             Raised when ``data`` is not in the ``.osr`` format.
         """
         if retrieve_beatmap:
-            if library is None and client is None:
-                raise ValueError(
-                    'one of library or client must be passed if you wish the'
-                    ' beatmap to be retrieved',
-                )
-
-            use_client = client is not None
-            if use_client:
-                if library is not None:
-                    raise ValueError(
-                        'only one of library or client can be passed'
-                    )
-                library = client.library
-
-        buffer = bytearray(data)
-
-        mode = GameMode(consume_byte(buffer))
-        version = consume_int(buffer)
-        beatmap_md5 = consume_string(buffer)
-        player_name = consume_string(buffer)
-        replay_md5 = consume_string(buffer)
-        count_300 = consume_short(buffer)
-        count_100 = consume_short(buffer)
-        count_50 = consume_short(buffer)
-        count_geki = consume_short(buffer)
-        count_katu = consume_short(buffer)
-        count_miss = consume_short(buffer)
-        score = consume_int(buffer)
-        max_combo = consume_short(buffer)
-        full_combo = bool(consume_byte(buffer))
-        mod_mask = consume_int(buffer)
-        life_bar_graph = _consume_life_bar_graph(buffer)
-        timestamp = consume_datetime(buffer)
-        actions = _consume_actions(buffer)
-
-        mod_kwargs = Mod.unpack(mod_mask)
-        # delete the alias field names
-        del mod_kwargs['relax2']
-        del mod_kwargs['last_mod']
+            library = _beatmap_source(library, client)
+
+        buffer = memoryview(data)
+        (mode,
+         version,
+         beatmap_md5,
+         player_name,
+         replay_md5,
+         count_300,
+         count_100,
+         count_50,
+         count_geki,
+         count_katu,
+         count_miss,
+         score,
+         max_combo,
+         full_combo,
+         mod_mask), offset = _read_header(buffer, 0)
+        life_bar_graph, offset = _read_life_bar_graph(buffer, offset)
+        timestamp_ticks, offset = read_long(buffer, offset)
+        actions, offset = _read_actions(buffer, offset)
 
         if retrieve_beatmap:
-            try:
-                beatmap = library.lookup_by_md5(beatmap_md5)
-            except KeyError:
-                if not use_client:
-                    raise
-                beatmap = client.beatmap(
-                    beatmap_md5=beatmap_md5,
-                ).beatmap(save=save)
+            beatmap = _retrieve_beatmap(beatmap_md5, library, client, save)
         else:
             beatmap = None
 
         return cls(
-            mode=mode,
-            version=version,
-            beatmap_md5=beatmap_md5,
-            player_name=player_name,
-            replay_md5=replay_md5,
-            count_300=count_300,
-            count_100=count_100,
-            count_50=count_50,
-            count_geki=count_geki,
-            count_katu=count_katu,
-            count_miss=count_miss,
-            score=score,
-            max_combo=max_combo,
-            full_combo=full_combo,
-            life_bar_graph=life_bar_graph,
-            timestamp=timestamp,
-            actions=actions,
-            beatmap=beatmap,
-            **mod_kwargs,
+            mode,
+            version,
+            beatmap_md5,
+            player_name,
+            replay_md5,
+            count_300,
+            count_100,
+            count_50,
+            count_geki,
+            count_katu,
+            count_miss,
+            score,
+            max_combo,
+            full_combo,
+            mod_mask,
+            life_bar_graph,
+            timestamp_ticks,
+            actions,
+            beatmap,
         )
 
     @lazyval
-    def hits(self):
-        """Dictionary containing beatmap's hit objects sorted into
-        300s, 100s, 50s, misses, slider_breaks as they were hit in the replay
-
-        Each hit object will be in exactly one category except sliders which
-        may be in slider_breaks in addition to another category
+    def _hit_categories(self):
+        """The hit objects of the beatmap along with how each was hit.
 
-        Slider calculations are unreliable so some objects may in the wrong
-        category.
-        Spinners are not yet calculated so are always in the 300s category.
+        Returns
+        -------
+        hit_objects : list[HitObject]
+            The hit objects as they appear with this replay's mods.
+        categories : np.ndarray[int8]
+            The ``_HIT_*`` code for each hit object.
+        slider_breaks : np.ndarray[bool]
+            Whether each hit object is a slider which was broken.
         """
         beatmap = self.beatmap
+        hit_objects = beatmap.hit_objects()
+        if self.hard_rock:
+            hit_objects = [obj.hard_rock for obj in hit_objects]
+
+        slider_breaks = np.zeros(len(hit_objects), dtype=bool)
+        if self.autoplay or self.cinema:
+            # autoplay hits every object perfectly, there is no need to look
+            # at the actions
+            categories = np.full(len(hit_objects), _HIT_300, dtype=np.int8)
+            return hit_objects, categories, slider_breaks
+
+        # indexing lists is much cheaper than indexing arrays one element at
+        # a time
         actions = self.actions
-        scores = {"300s": [],
-                  "100s": [],
-                  "50s": [],
-                  "misses": [],
-                  "slider_breaks": [],
-                  }
+        offsets = actions.offset_ms.tolist()
+        xs = actions.x.tolist()
+        ys = actions.y.tolist()
+        key1 = actions.key1.tolist()
+        key2 = actions.key2.tolist()
+        columns = offsets, xs, ys, actions.pressed.tolist()
+
+        categories = np.full(len(hit_objects), -1, dtype=np.int8)
         hw = od_to_ms(beatmap.od(easy=self.easy, hard_rock=self.hard_rock))
         rad = circle_radius(
             beatmap.cs(easy=self.easy, hard_rock=self.hard_rock),
         )
-        hit_50_threshold = datetime.timedelta(milliseconds=hw.hit_50)
+        hit_50_threshold = hw.hit_50
         i = 0
-        for obj in beatmap.hit_objects():
-            if self.hard_rock:
-                obj = obj.hard_rock
+        for ix, obj in enumerate(hit_objects):
             if isinstance(obj, Spinner):
                 # spinners are hard
-                scores['300s'].append(obj)
+                categories[ix] = _HIT_300
                 continue
+            obj_time = obj.time / _one_ms
             # we can ignore events before the hit window so iterate
             # until we get past the beginning of the hit window
-            while actions[i].offset < obj.time - hit_50_threshold:
+            while offsets[i] < obj_time - hit_50_threshold:
                 i += 1
             starti = i
-            while actions[i].offset < obj.time + hit_50_threshold:
-                if (((actions[i].key1 and not actions[i - 1].key1)
-                        or (actions[i].key2 and not actions[i - 1].key2))
-                        and _within(actions[i].position, obj.position, rad)):
+            while offsets[i] < obj_time + hit_50_threshold:
+                if (((key1[i] and not key1[i - 1])
+                        or (key2[i] and not key2[i - 1]))
+                        and _within(obj.position, xs[i], ys[i], rad)):
                     # key pressed that wasn't before and
                     # event is in hit window and correct location
                     if isinstance(obj, Circle):
-                        _process_circle(obj, actions[i], hw, scores)
+                        _process_circle(
+                            ix,
+                            obj_time,
+                            offsets[i],
+                            hw,
+                            categories,
+                        )
                     elif isinstance(obj, Slider):
                         # Head was hit
                         starti = i
-                        while actions[i].offset <= obj.end_time:
+                        end_time = obj.end_time / _one_ms
+                        while offsets[i] <= end_time:
                             i += 1
                         _process_slider(
-                            obj, actions[starti:i + 1], True, rad, scores
+                            ix,
+                            obj,
+                            obj_time,
+                            columns,
+                            starti,
+                            i + 1,
+                            True,
+                            rad,
+                            categories,
+                            slider_breaks,
                         )
                     break
                 i += 1
@@ -747,15 +1338,52 @@ class Replay:
                 # no events in the hit window were in the correct location
                 if isinstance(obj, Slider):
                     # Slider ticks might still be hit
-                    while actions[i].offset <= obj.end_time:
+                    end_time = obj.end_time / _one_ms
+                    while offsets[i] <= end_time:
                         i += 1
                     _process_slider(
-                        obj, actions[starti:i + 1], False, rad, scores
+                        ix,
+                        obj,
+                        obj_time,
+                        columns,
+                        starti,
+                        i + 1,
+                        False,
+                        rad,
+                        categories,
+                        slider_breaks,
                     )
                 else:
-                    scores["misses"].append(obj)
+                    categories[ix] = _HIT_MISS
             i += 1
-        return scores
+        return hit_objects, categories, slider_breaks
+
+    @lazyval
+    def hits(self):
+        """Dictionary containing beatmap's hit objects sorted into
+        300s, 100s, 50s, misses, slider_breaks as they were hit in the replay
+
+        Each hit object will be in exactly one category except sliders which
+        may be in slider_breaks in addition to another category
+
+        Slider calculations are unreliable so some objects may in the wrong
+        category.
+        Spinners are not yet calculated so are always in the 300s category.
+        Replays using autoplay or cinema place every object in the 300s
+        category.
+        """
+        hit_objects, categories, slider_breaks = self._hit_categories
+
+        def select(mask):
+            return [hit_objects[ix] for ix in np.flatnonzero(mask)]
+
+        return {
+            "300s": select(categories == _HIT_300),
+            "100s": select(categories == _HIT_100),
+            "50s": select(categories == _HIT_50),
+            "misses": select(categories == _HIT_MISS),
+            "slider_breaks": select(slider_breaks),
+        }
 
     def __repr__(self):
         try:
@@ -0,0 +1,18 @@
+import pytest
+
+import slider.example_data.beatmaps
+
+
+# Parsing the example beatmaps dominates the runtime of the test suite. The
+# parsed beatmaps are never mutated by the tests so they are shared across the
+# whole session.
+
+
+@pytest.fixture(scope='session')
+def beatmap():
+    return slider.example_data.beatmaps.miiro_vs_ai_no_scenario('Tatoe')
+
+
+@pytest.fixture(scope='session')
+def beginner_beatmap():
+    return slider.example_data.beatmaps.miiro_vs_ai_no_scenario('Beginner')
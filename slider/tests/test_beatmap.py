@@ -1,4 +1,4 @@
-import pytest
+import numpy as np
 
 import slider.example_data.beatmaps
 import slider.beatmap
@@ -6,11 +6,10 @@ import slider.curve
 from slider.position import Position
 from datetime import timedelta
 from math import isclose
-
-
-@pytest.fixture
-def beatmap():
-    return slider.example_data.beatmaps.miiro_vs_ai_no_scenario('Tatoe')
+from operator import attrgetter
+import os
+from pathlib import Path
+import pickle
 
 
 def test_parse_beatmap_format_v3():
@@ -141,51 +140,64 @@ def test_parse_section_hit_objects(beatmap):
     assert hit_objects_0.addition == "0:0:0:0:"
 
 
+# the arguments for a minimal ``Beatmap`` which tests can add hit objects to
+_DUMMY_BEATMAP_KWARGS = {
+    'format_version': 14,
+    'audio_filename': "audio.mp3",
+    'audio_lead_in': timedelta(),
+    'preview_time': timedelta(),
+    'countdown': False,
+    'sample_set': "soft",
+    'stack_leniency': 1,
+    'mode': 0,
+    'letterbox_in_breaks': False,
+    'widescreen_storyboard': False,
+    'bookmarks': [0],
+    'distance_spacing': 1,
+    'beat_divisor': 1,
+    'grid_size': 1,
+    'timeline_zoom': 1,
+    'title': "title",
+    'title_unicode': "title",
+    'artist': "artist",
+    'artist_unicode': "artist",
+    'creator': "creator",
+    'version': "1.0",
+    'source': "source",
+    'tags': ["tags"],
+    'beatmap_id': 0,
+    'beatmap_set_id': 0,
+    'hp_drain_rate': 5,
+    'circle_size': 5,
+    'overall_difficulty': 5,
+    'approach_rate': 5,
+    'slider_multiplier': 1,
+    'slider_tick_rate': 1,
+    'timing_points': [],
+}
+
+
 def test_hit_objects_stacking():
     hit_objects = [slider.beatmap.Circle(Position(128, 128),
                                          timedelta(milliseconds=x*10),
                                          hitsound=1) for x in range(10)]
 
     beatmap = slider.Beatmap(
-        format_version=14,
-        audio_filename="audio.mp3",
-        audio_lead_in=timedelta(),
-        preview_time=timedelta(),
-        countdown=False,
-        sample_set="soft",
-        stack_leniency=1,
-        mode=0,
-        letterbox_in_breaks=False,
-        widescreen_storyboard=False,
-        bookmarks=[0],
-        distance_spacing=1,
-        beat_divisor=1,
-        grid_size=1,
-        timeline_zoom=1,
-        title="title",
-        title_unicode="title",
-        artist="artist",
-        artist_unicode="artist",
-        creator="creator",
-        version="1.0",
-        source="source",
-        tags=["tags"],
-        beatmap_id=0,
-        beatmap_set_id=0,
-        hp_drain_rate=5,
-        circle_size=5,
-        overall_difficulty=5,
-        approach_rate=5,
-        slider_multiplier=1,
-        slider_tick_rate=1,
-        timing_points=[],
-        hit_objects=hit_objects
+        **_DUMMY_BEATMAP_KWARGS,
+        hit_objects=hit_objects,
     )
     radius = slider.beatmap.circle_radius(5)
     stack_offset = radius / 10
 
-    for i, ob in enumerate(reversed(beatmap.hit_objects(stacking=True))):
-        assert ob.position.y == 128-(i*stack_offset)
+    ys = beatmap.hit_object_positions(stacking=True)[:, 1]
+    np.testing.assert_array_equal(
+        ys,
+        128 - np.arange(9, -1, -1) * stack_offset,
+    )
+    np.testing.assert_array_equal(
+        beatmap.stack_heights(),
+        np.arange(9, -1, -1),
+    )
 
 
 def test_hit_objects_hard_rock(beatmap):
@@ -197,9 +209,59 @@ def test_hit_objects_hard_rock(beatmap):
                                                     Position(x=301, y=209)]
 
 
-def test_legacy_slider_end():
-    beatmap = slider.example_data.beatmaps.miiro_vs_ai_no_scenario()
+def test_hit_object_positions(beatmap):
+    for kwargs in {}, {'stacking': False}, {'hard_rock': True}:
+        positions = beatmap.hit_object_positions(**kwargs)
+        assert positions.shape == (len(beatmap.hit_objects(**kwargs)), 2)
+        assert positions.tolist() == [
+            list(ob.position) for ob in beatmap.hit_objects(**kwargs)
+        ]
+
+    empty = beatmap.hit_object_positions(
+        circles=False,
+        sliders=False,
+        spinners=False,
+    )
+    assert empty.shape == (0, 2)
+
+
+def test_stack_heights(beatmap):
+    stack_heights = beatmap.stack_heights()
+    assert stack_heights.dtype == np.int32
+    assert stack_heights.shape == (len(beatmap.hit_objects()),)
+
+    moved = np.any(
+        beatmap.hit_object_positions() !=
+        beatmap.hit_object_positions(stacking=False),
+        axis=1,
+    )
+    np.testing.assert_array_equal(stack_heights != 0, moved)
+
+    circles = beatmap.stack_heights(sliders=False, spinners=False)
+    assert len(circles) == len(
+        beatmap.hit_objects(sliders=False, spinners=False),
+    )
+
+
+def test_hit_objects_cached(beatmap):
+    hit_objects = beatmap.hit_objects()
+    assert beatmap.hit_objects() is hit_objects
+
+    hit_objects_hard_rock = beatmap.hit_objects(hard_rock=True)
+    assert hit_objects_hard_rock is not hit_objects
+    assert beatmap.hit_objects(hard_rock=True) is hit_objects_hard_rock
+
+
+def test_stacking_copies_hit_objects(beatmap):
+    unstacked = [ob.position for ob in beatmap.hit_objects(stacking=False)]
+    stacked = beatmap.hit_objects()
+    assert [ob.position for ob in beatmap.hit_objects(stacking=False)] == (
+        unstacked
+    )
+    assert [ob.position for ob in stacked] != unstacked
+
 
+def test_legacy_slider_end(beatmap):
     # lazer uses float values for the duration of sliders instead of ints as in
     # this library. This means we'll have some rounding errors against the
     # expected position of the last tick. `leniency` is the number of pixels of
@@ -208,20 +270,16 @@ def test_legacy_slider_end():
     # https://github.com/llllllllll/slider/pull/106#issuecomment-1399583672.
     def test_slider(slider_, expected_last_tick_pos, end_pos, leniency=2):
         assert isinstance(slider_, slider.beatmap.Slider)
-        expected_x = expected_last_tick_pos.x
-        expected_y = expected_last_tick_pos.y
 
         last_tick_true = slider_.true_tick_points[-1]
 
         # make sure the last tick is where we expect it to be
-        assert abs(last_tick_true.x - expected_x) <= leniency
-        assert abs(last_tick_true.y - expected_y) <= leniency
+        assert expected_last_tick_pos.close_to(last_tick_true, leniency)
 
         last_tick = slider_.tick_points[-1]
 
         # Make sure the actual sliderends didnt get changed
-        assert abs(last_tick.x - end_pos.x) <= leniency
-        assert abs(last_tick.y - end_pos.y) <= leniency
+        assert end_pos.close_to(last_tick, leniency)
 
     objects = beatmap.hit_objects()
 
@@ -242,11 +300,12 @@ def test_legacy_slider_end():
     test_slider(slider2, expected_last_tick_pos2, end_pos2)
 
 
-def test_closest_hitobject():
-    beatmap = slider.example_data.beatmaps.miiro_vs_ai_no_scenario('Beginner')
-    hit_object1 = beatmap.hit_objects()[4]
-    hit_object2 = beatmap.hit_objects()[5]
-    hit_object3 = beatmap.hit_objects()[6]
+def test_closest_hitobject(beginner_beatmap):
+    beatmap = beginner_beatmap
+    hit_objects = beatmap.hit_objects(stacking=False)
+    hit_object1 = hit_objects[4]
+    hit_object2 = hit_objects[5]
+    hit_object3 = hit_objects[6]
 
     middle_t = timedelta(milliseconds=11076 - ((11076 - 9692) / 2))
 
@@ -260,6 +319,10 @@ def test_closest_hitobject():
         hit_object1
     assert beatmap.closest_hitobject(middle_t) == hit_object2
     assert beatmap.closest_hitobject(middle_t, side="right") == hit_object3
+    assert beatmap.closest_hitobject(
+        timedelta(milliseconds=9692 + 30),
+        side="right",
+    ) == hit_object2
 
 
 def test_ar(beatmap):
@@ -321,9 +384,24 @@ def test_pack(beatmap):
         'volume', 'kiai_mode'
     ]
 
-    def check_attrs(object1, object2, attr_list):
-        for attr in attr_list:
-            assert getattr(object1, attr) == getattr(object2, attr)
+    def attrs_checker(attr_list):
+        get = attrgetter(*attr_list)
+
+        def check_attrs(object1, object2):
+            values1 = get(object1)
+            values2 = get(object2)
+            if values1 != values2:
+                # name the values so the failure shows which attribute differs
+                assert dict(zip(attr_list, values1)) == dict(
+                    zip(attr_list, values2),
+                )
+
+        return check_attrs
+
+    check_beatmap_attrs = attrs_checker(beatmap_attrs)
+    check_hitobj_attrs = attrs_checker(hitobj_attrs)
+    check_slider_attrs = attrs_checker(slider_attrs)
+    check_timing_point_attrs = attrs_checker(timing_point_attrs)
 
     def check_curve(curve1, curve2):
         assert type(curve1) is type(curve2)
@@ -331,16 +409,16 @@ def test_pack(beatmap):
         for point1, point2 in zip(curve1.points, curve2.points):
             assert point1 == point2
 
-    check_attrs(beatmap, packed, beatmap_attrs)
+    check_beatmap_attrs(beatmap, packed)
 
     # check hit objects
     assert len(beatmap._hit_objects) == len(packed._hit_objects)
     for hitobj1, hitobj2 in zip(beatmap._hit_objects, packed._hit_objects):
         assert type(hitobj1) is type(hitobj2)
-        check_attrs(hitobj1, hitobj2, hitobj_attrs)
+        check_hitobj_attrs(hitobj1, hitobj2)
 
         if isinstance(hitobj1, slider.beatmap.Slider):
-            check_attrs(hitobj1, hitobj2, slider_attrs)
+            check_slider_attrs(hitobj1, hitobj2)
             check_curve(hitobj1.curve, hitobj2.curve)
         elif isinstance(hitobj1, (slider.beatmap.Spinner,
                                   slider.beatmap.HoldNote)):
@@ -351,6 +429,54 @@ def test_pack(beatmap):
     # check timing points
     assert len(beatmap.timing_points) == len(packed.timing_points)
     for tp1, tp2 in zip(beatmap.timing_points, packed.timing_points):
-        check_attrs(tp1, tp2, timing_point_attrs)
+        check_timing_point_attrs(tp1, tp2)
         # make sure both timing points are either inherited or uninherited
         assert (tp1.parent is not None) == (tp2.parent is not None)
+
+
+def test_from_path_cached(tmp_path):
+    source = (
+        Path(slider.example_data.beatmaps.__file__).parent /
+        'AKINO from bless4 & CHiCO with HoneyWorks - MIIRO vs. Ai no Scenario'
+        ' (monstrata) [Tatoe].osu'
+    )
+    path = tmp_path / 'tatoe.osu'
+    path.write_bytes(source.read_bytes())
+
+    beatmap = slider.Beatmap.from_path_cached(path)
+    assert slider.Beatmap.from_path_cached(str(path)) is beatmap
+    assert slider.Beatmap.from_path(path) is not beatmap
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    reparsed = slider.Beatmap.from_path_cached(path)
+    assert reparsed is not beatmap
+    assert reparsed.version == beatmap.version
+
+
+def test_from_path_cached_relative_path(tmp_path, monkeypatch):
+    example_dir = Path(slider.example_data.beatmaps.__file__).parent
+    mtime_ns = 10 ** 18
+    for version in 'Tatoe', 'Beginner':
+        source = example_dir / (
+            'AKINO from bless4 & CHiCO with HoneyWorks - MIIRO vs. Ai no'
+            f' Scenario (monstrata) [{version}].osu'
+        )
+        directory = tmp_path / version
+        directory.mkdir()
+        path = directory / 'map.osu'
+        path.write_bytes(source.read_bytes())
+        # give both files the same mtime so only the path tells them apart
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    for version in 'Tatoe', 'Beginner':
+        monkeypatch.chdir(tmp_path / version)
+        assert slider.Beatmap.from_path_cached('map.osu').version == version
+
+
+def test_pickle(beatmap):
+    unpickled = pickle.loads(pickle.dumps(beatmap))
+    assert unpickled.pack() == beatmap.pack()
+    assert unpickled.hit_object_positions().tolist() == (
+        beatmap.hit_object_positions().tolist()
+    )
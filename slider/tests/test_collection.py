@@ -1,8 +1,14 @@
+import pytest
+
 import slider.example_data.collections
 
 
-def test_collection_simple():
-    collection_db = slider.example_data.collections.test_db()
+@pytest.fixture(scope='module')
+def collection_db():
+    return slider.example_data.collections.test_db()
+
+
+def test_collection_simple(collection_db):
     assert collection_db.version == 20190410
     assert collection_db.num_collections == 2
 
@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+from slider.position import Point, Position
+
+
+def test_position_slots():
+    assert not hasattr(Position(1, 2), '__dict__')
+    assert not hasattr(Point(1, 2, timedelta()), '__dict__')
+
+
+def test_close_to():
+    position = Position(10, 20)
+    assert position.close_to(Position(12, 18), 2)
+    assert position.close_to(Point(10.5, 20, timedelta()), 1)
+    assert not position.close_to(Position(13, 20), 2)
+    assert not position.close_to(Position(10, 17), 2)
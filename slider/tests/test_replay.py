@@ -0,0 +1,336 @@
+from datetime import datetime, timedelta
+import lzma
+import pickle
+import struct
+
+import numpy as np
+import pytest
+
+from slider.beatmap import Circle, Slider
+from slider.game_mode import GameMode
+from slider.mod import Mod, od_to_ms
+from slider.position import Position
+from slider.replay import Replay
+
+
+def _string(value):
+    encoded = value.encode('utf-8')
+    # every string in these tests is shorter than 128 bytes so the length
+    # fits in a single uleb128 byte
+    return b'\x0b' + bytes([len(encoded)]) + encoded
+
+
+def _osr(actions,
+         *,
+         mode=GameMode.standard,
+         player_name='player',
+         counts=(10, 2, 1, 3, 1, 4),
+         mods=0,
+         life_bar_graph='0|1,'):
+    compressed = lzma.compress(
+        actions.encode('ascii'),
+        format=lzma.FORMAT_ALONE,
+    )
+    return b''.join([
+        struct.pack('<BI', mode, 20190410),
+        _string('0' * 32),
+        _string(player_name),
+        _string('f' * 32),
+        struct.pack('<HHHHHHIHBI', *counts, 123456, 7, 0, mods),
+        _string(life_bar_graph),
+        struct.pack('<Q', 636996000000000000),
+        struct.pack('<I', len(compressed)),
+        compressed,
+        struct.pack('<Q', 0),
+    ])
+
+
+def _play(beatmap, *, hard_rock=False):
+    """Build the actions of a play of ``beatmap``.
+
+    The circles are hit in turn for a 300, a 100, a 50 and off target. Every
+    other slider is followed along its curve and the rest are left alone.
+    """
+    hit_windows = od_to_ms(beatmap.od(hard_rock=hard_rock))
+    late_by = (
+        0,
+        (hit_windows.hit_300 + hit_windows.hit_100) / 2,
+        (hit_windows.hit_100 + hit_windows.hit_50) / 2,
+        0,
+    )
+
+    hit_objects = beatmap.hit_objects()
+    if hard_rock:
+        hit_objects = [ob.hard_rock for ob in hit_objects]
+
+    frames = [(-500, 256, -500, 0)]
+    circles = sliders = 0
+    for ob in hit_objects:
+        time = ob.time / timedelta(milliseconds=1)
+        p = ob.position
+        if isinstance(ob, Circle):
+            t = round(time + late_by[circles % 4])
+            x = p.x + 200 if circles % 4 == 3 else p.x
+            frames.append((t, x, p.y, 5))
+            frames.append((t + 10, x, p.y, 0))
+            circles += 1
+        elif isinstance(ob, Slider):
+            if sliders % 2 == 0:
+                end_time = ob.end_time / timedelta(milliseconds=1)
+                t = round(time)
+                while t <= end_time:
+                    q = ob.curve(min(1, (t - time) / (end_time - time)))
+                    frames.append((t, q.x, q.y, 5))
+                    t += 10
+                frames.append((t, q.x, q.y, 0))
+            sliders += 1
+
+    last = hit_objects[-1]
+    end_time = getattr(last, 'end_time', last.time) / timedelta(milliseconds=1)
+    frames.append((round(end_time) + 1000, 256, 192, 0))
+
+    actions = []
+    previous = 0
+    for t, x, y, mask in frames:
+        actions.append(f'{t - previous}|{x}|{y}|{mask}')
+        previous = t
+    return ','.join(actions) + ','
+
+
+@pytest.fixture
+def replay():
+    return Replay.parse(
+        _osr(
+            '0|256|-500|0,-1|256|-500|0,10|1.5|2|1,16|3|4.25|10,',
+            mods=Mod.hidden | Mod.double_time,
+            life_bar_graph='0|1,500|0.5,',
+        ),
+        retrieve_beatmap=False,
+    )
+
+
+def test_parse_header(replay):
+    assert replay.mode == GameMode.standard
+    assert replay.version == 20190410
+    assert replay.player_name == 'player'
+    assert replay.count_300 == 10
+    assert replay.count_miss == 4
+    assert replay.score == 123456
+    assert replay.max_combo == 7
+    assert not replay.full_combo
+    assert replay.beatmap is None
+
+
+def test_parse_mods(replay):
+    assert replay.mod_mask == Mod.hidden | Mod.double_time
+    assert replay.hidden
+    assert replay.double_time
+    assert not replay.hard_rock
+    assert not replay.easy
+
+
+def test_parse_timestamp(replay):
+    assert replay.timestamp_ticks == 636996000000000000
+    assert replay.timestamp == datetime(2019, 7, 24, 21, 20)
+
+
+def test_parse_life_bar_graph(replay):
+    assert list(replay.life_bar_graph) == [
+        (timedelta(0), 1.0),
+        (timedelta(milliseconds=500), 0.5),
+    ]
+
+
+def test_parse_actions(replay):
+    actions = replay.actions
+    assert actions is not None
+    assert len(actions) == 4
+
+    action = actions[2]
+    assert action.offset == timedelta(milliseconds=9)
+    assert action.position == Position(1.5, 2)
+    assert action.key1
+    assert not action.key2
+    assert action.mouse1
+    assert not action.mouse2
+
+    action = actions[3]
+    assert action.offset == timedelta(milliseconds=25)
+    assert action.position == Position(3, 4.25)
+    assert not action.key1
+    assert action.key2
+    assert not action.mouse1
+    assert action.mouse2
+
+
+def test_pickle(replay):
+    # ``Replay.from_directory`` sends replays between processes with pickle
+    unpickled = pickle.loads(pickle.dumps(replay))
+    assert unpickled.player_name == replay.player_name
+    assert unpickled.mod_mask == replay.mod_mask
+    assert unpickled.timestamp == replay.timestamp
+    assert list(unpickled.life_bar_graph) == list(replay.life_bar_graph)
+    assert [
+        (action.offset, action.position, action.action_bitmask)
+        for action in unpickled.actions
+    ] == [
+        (action.offset, action.position, action.action_bitmask)
+        for action in replay.actions
+    ]
+
+
+@pytest.mark.parametrize('actions', [
+    '0|256|-500,',
+    # the right number of fields, but not split into frames of four
+    '0|1|2,3,',
+    '0|1|2|3|4,5|6|7,',
+    # a bad number in the middle must not truncate the actions
+    '0|1|2|0,x|1|2|3,',
+])
+def test_parse_malformed_actions(actions):
+    with pytest.raises(ValueError):
+        Replay.parse(_osr(actions), retrieve_beatmap=False)
+
+
+def test_parse_empty_action_frames():
+    replay = Replay.parse(_osr(',0|1|2|0,,5|3|4|5,'), retrieve_beatmap=False)
+    assert [
+        (action.offset, action.position) for action in replay.actions
+    ] == [
+        (timedelta(0), Position(1, 2)),
+        (timedelta(milliseconds=5), Position(3, 4)),
+    ]
+
+
+@pytest.mark.parametrize('life_bar_graph', [
+    '0|1|2,',
+    '0|1,500,',
+    '0|1,x|0.5,',
+])
+def test_parse_malformed_life_bar_graph(life_bar_graph):
+    replay = Replay.parse(
+        _osr('0|0|0|0,', life_bar_graph=life_bar_graph),
+        retrieve_beatmap=False,
+    )
+    # the graph is decoded lazily
+    with pytest.raises(ValueError):
+        list(replay.life_bar_graph)
+
+
+def test_parse_empty_life_bar_graph_points():
+    replay = Replay.parse(
+        _osr('0|0|0|0,', life_bar_graph='0|1,,500|0.5,'),
+        retrieve_beatmap=False,
+    )
+    assert list(replay.life_bar_graph) == [
+        (timedelta(0), 1.0),
+        (timedelta(milliseconds=500), 0.5),
+    ]
+
+
+def _write_replay_directory(path):
+    (path / 'a.osr').write_bytes(
+        _osr('0|0|0|0,', player_name='a', mods=Mod.hidden),
+    )
+    (path / 'b.osr').write_bytes(
+        _osr(
+            '0|0|0|0,16|1|2|5,',
+            player_name='b',
+            counts=(5, 0, 0, 0, 0, 5),
+        ),
+    )
+    (path / 'c.osr').write_bytes(
+        _osr('0|0|0|0,', player_name='c', mode=GameMode.taiko),
+    )
+    (path / 'not-a-replay.txt').write_bytes(b'')
+
+
+def test_from_directory_max_workers(tmp_path):
+    _write_replay_directory(tmp_path)
+
+    serial = Replay.from_directory(tmp_path, retrieve_beatmap=False)
+    parallel = Replay.from_directory(
+        tmp_path,
+        retrieve_beatmap=False,
+        max_workers=2,
+    )
+    assert len(parallel) == len(serial) == 3
+    for a, b in zip(parallel, serial):
+        assert a.player_name == b.player_name
+        assert a.mod_mask == b.mod_mask
+        assert a.actions.offset_ms.tolist() == b.actions.offset_ms.tolist()
+
+
+def test_bulk_from_directory(tmp_path):
+    _write_replay_directory(tmp_path)
+
+    table = Replay.bulk_from_directory(tmp_path)
+    assert len(table) == 3
+
+    replays = Replay.from_directory(tmp_path, retrieve_beatmap=False)
+    for replay in replays:
+        ix, = np.flatnonzero(table.player_name == replay.player_name)
+        assert table.mode[ix] == replay.mode
+        assert table.beatmap_md5[ix] == replay.beatmap_md5
+        assert table.count_300[ix] == replay.count_300
+        assert table.count_miss[ix] == replay.count_miss
+        assert table.score[ix] == replay.score
+        assert table.mod_mask[ix] == replay.mod_mask
+        assert table.timestamp_ticks[ix] == replay.timestamp_ticks
+        if replay.mode == GameMode.standard:
+            assert table.accuracy[ix] == replay.accuracy
+        else:
+            assert np.isnan(table.accuracy[ix])
+
+
+def _hit_indices(replay):
+    times = [ob.time for ob in replay.beatmap.hit_objects()]
+    return {
+        category: [times.index(ob.time) for ob in hit_objects]
+        for category, hit_objects in replay.hits.items()
+    }
+
+
+@pytest.mark.parametrize('mods', [0, Mod.hidden, Mod.hard_rock])
+def test_hits(beginner_beatmap, mods):
+    replay = Replay.parse(
+        _osr(
+            _play(beginner_beatmap, hard_rock=bool(mods & Mod.hard_rock)),
+            mods=mods,
+        ),
+        retrieve_beatmap=False,
+    )
+    replay.beatmap = beginner_beatmap
+    # Followed sliders still count as broken and the first press after an
+    # ignored slider is skipped. These are quirks of the hit judgement which
+    # this test pins down so that rewrites keep the same results.
+    assert _hit_indices(replay) == {
+        '300s': [0, 1, 21, 31, 39, 47],
+        '100s': [3, 5, 7, 9, 10, 13, 18, 20, 23, 26, 30, 34, 38, 42, 46],
+        '50s': [2, 4, 6, 22, 24, 25, 35, 43],
+        'misses': [
+            8, 11, 12, 14, 15, 16, 17, 19, 27, 28,
+            29, 32, 33, 36, 37, 40, 41, 44, 45, 48,
+        ],
+        'slider_breaks': [
+            2, 3, 4, 5, 6, 7, 8, 9, 11, 13,
+            15, 18, 19, 20, 22, 23, 25, 26, 28, 30,
+            32, 34, 36, 38, 40, 42, 44, 46, 48,
+        ],
+    }
+
+
+def test_hits_autoplay(beginner_beatmap):
+    replay = Replay.parse(
+        _osr('0|256|-500|0,', mods=Mod.autoplay),
+        retrieve_beatmap=False,
+    )
+    replay.beatmap = beginner_beatmap
+    # autoplay hits every object without looking at the actions
+    assert replay.hits == {
+        '300s': list(beginner_beatmap.hit_objects()),
+        '100s': [],
+        '50s': [],
+        'misses': [],
+        'slider_breaks': [],
+    }
@@ -1,3 +1,8 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
 import slider.utils
 
 
@@ -7,3 +12,110 @@ def test_accuracy():
     assert round(slider.utils.accuracy(0, 0, 1, 0), 4) == 0.1667
     assert slider.utils.accuracy(0, 0, 0, 1) == 0.0
     assert round(slider.utils.accuracy(982, 100, 43, 14), 4) == 0.8977
+
+
+def test_accuracy_array():
+    counts = np.array([
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, 1],
+        [982, 100, 43, 14],
+    ])
+    np.testing.assert_allclose(
+        slider.utils.accuracy(*counts.T),
+        [slider.utils.accuracy(*row) for row in counts.tolist()],
+    )
+
+
+def test_read_uleb128():
+    cases = [
+        (b'\x00', 0),
+        (b'\x7f', 127),
+        (b'\x80\x01', 128),
+        (b'\xff\x7f', 16383),
+        (b'\x80\x80\x01', 16384),
+        (b'\xe5\x8e\x26', 624485),
+        (b'\xff\xff\x7f', 2 ** 21 - 1),
+        (b'\x80\x80\x80\x01', 2 ** 21),
+        (b'\xff\xff\xff\xff\x0f', 2 ** 32 - 1),
+    ]
+    for encoded, expected in cases:
+        buffer = memoryview(b'\x0b' + encoded + b'\x0b')
+        assert slider.utils.read_uleb128(buffer, 1) == (
+            expected,
+            len(encoded) + 1,
+        )
+
+
+def test_lazyval():
+    class C:
+        calls = 0
+
+        @slider.utils.lazyval
+        def value(self):
+            """The value."""
+            type(self).calls += 1
+            return object()
+
+    assert C.value.__doc__ == 'The value.'
+
+    c = C()
+    value = c.value
+    assert c.value is value
+    assert C.calls == 1
+
+    c.value = 1
+    assert c.value == 1
+
+
+def test_consume():
+    buffer = bytearray(
+        b'\x01'
+        b'\x02\x00'
+        b'\x03\x00\x00\x00'
+        b'\x0b\x02hi'
+        b'\x80\x01'
+        b'rest'
+    )
+    assert slider.utils.consume_byte(buffer) == 1
+    assert slider.utils.consume_short(buffer) == 2
+    assert slider.utils.consume_int(buffer) == 3
+    assert slider.utils.consume_string(buffer) == 'hi'
+    assert slider.utils.consume_uleb128(buffer) == 128
+    assert buffer == b'rest'
+
+
+def test_datetime_from_ticks():
+    assert slider.utils.datetime_from_ticks(0) == datetime(1, 1, 1)
+    assert slider.utils.datetime_from_ticks(637000000000001237) == datetime(
+        2019, 7, 29, 12, 26, 40, 123,
+    )
+
+
+def test_mapped_file(tmp_path):
+    path = tmp_path / 'data'
+    path.write_bytes(b'abc')
+    with slider.utils.mapped_file(path) as data:
+        assert data[:] == b'abc'
+    assert data.closed
+
+    empty = tmp_path / 'empty'
+    empty.write_bytes(b'')
+    with slider.utils.mapped_file(empty) as data:
+        assert data == b''
+
+
+def test_mapped_file_error(tmp_path):
+    path = tmp_path / 'data'
+    path.write_bytes(b'abc')
+
+    def parse(data):
+        view = memoryview(data)[1:]  # noqa: F841
+        raise ValueError('bad data')
+
+    # the view held by the traceback must not replace the parse error with a
+    # BufferError from closing the mapping
+    with pytest.raises(ValueError, match='bad data'):
+        with slider.utils.mapped_file(path) as data:
+            parse(data)
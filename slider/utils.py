@@ -1,13 +1,25 @@
+from contextlib import contextmanager
 from functools import lru_cache
 import datetime
+import mmap
+import struct
 
 
 class lazyval:
     """Decorator to lazily compute and cache a value.
+
+    Notes
+    -----
+    This works like :class:`functools.cached_property`, which is not
+    available on all of the versions of Python we support. The value is
+    stored in the instance ``__dict__`` under the same name; because this is
+    a non-data descriptor, later lookups find the cached value directly
+    without calling back into the descriptor.
     """
     def __init__(self, fget):
         self._fget = fget
         self._name = None
+        self.__doc__ = fget.__doc__
 
     def __set_name__(self, owner, name):
         self._name = name
@@ -16,13 +28,9 @@ class lazyval:
         if instance is None:
             return self
 
-        value = self._fget(instance)
-        vars(instance)[self._name] = value
+        value = instance.__dict__[self._name] = self._fget(instance)
         return value
 
-    def __set__(self, instance, value):
-        vars(instance)[self._name] = value
-
 
 class no_default:
     """Sentinel type; this should not be instantiated.
@@ -47,19 +55,25 @@ def accuracy(count_300, count_100, count_50, count_miss):
 
     Parameters
     ----------
-    count_300 : int
+    count_300 : int or np.ndarray[int]
         The number of 300's hit.
-    count_100 : int
+    count_100 : int or np.ndarray[int]
         The number of 100's hit.
-    count_50 : int
+    count_50 : int or np.ndarray[int]
         The number of 50's hit.
-    count_miss : int
+    count_miss : int or np.ndarray[int]
         The number of misses
 
     Returns
     -------
-    accuracy : float
+    accuracy : float or np.ndarray[float]
         The accuracy in the range [0, 1]
+
+    Notes
+    -----
+    The counts may be numpy arrays to compute the accuracy of many plays at
+    once. The arrays should have a signed integer dtype at least 32 bits wide
+    so that the weighted sums do not overflow.
     """
     points_of_hits = count_300 * 300 + count_100 * 100 + count_50 * 50
     total_hits = count_300 + count_100 + count_50 + count_miss
@@ -105,62 +119,166 @@ def orange(_start_or_stop, *args):
         start += step
 
 
-# consume_* helper functions to read osu! binary files
+_windows_epoch = datetime.datetime(1, 1, 1)
+_timedelta = datetime.timedelta
+
+
+def datetime_from_ticks(windows_ticks):
+    """Convert a .NET ``DateTime`` tick count to a datetime.
+
+    Parameters
+    ----------
+    windows_ticks : int
+        The number of 100 nanosecond ticks since 0001-01-01.
+
+    Returns
+    -------
+    dt : datetime.datetime
+        The corresponding datetime.
+    """
+    # use integer division: a float cannot hold present day tick counts
+    # exactly, which would round the result to a multiple of 8 microseconds
+    return _windows_epoch + _timedelta(microseconds=windows_ticks // 10)
+
+
+@contextmanager
+def mapped_file(path):
+    """Map a file into memory for reading.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The path to the file to map.
+
+    Yields
+    ------
+    data : mmap.mmap or bytes
+        The contents of the file. Empty files cannot be mapped, so they
+        produce ``b''``.
+
+    Notes
+    -----
+    The mapping is closed when the block exits, so parsers must not keep
+    views of ``data`` past the end of the block.
+    """
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            data = None
+
+    if data is None:
+        yield b''
+        return
+
+    try:
+        yield data
+    except BaseException:
+        # the traceback may still hold views of the mapping in the frames of
+        # the parser which failed; closing it would then raise a BufferError
+        # which hides the real error, so leave it to be unmapped when those
+        # views are released
+        try:
+            data.close()
+        except BufferError:
+            pass
+        raise
+
+    data.close()
 
-def consume_byte(buffer):
-    result = buffer[0]
-    del buffer[0]
-    return result
 
+# read_* helper functions to read osu! binary files. These take a buffer and
+# an offset into it and return the value read along with the offset of the
+# next field, so reading a field never copies or shifts the rest of the data.
 
-def consume_short(buffer):
-    result = int.from_bytes(buffer[:2], 'little')
-    del buffer[:2]
-    return result
+_unpack_short = struct.Struct('<H').unpack_from
+_unpack_int = struct.Struct('<I').unpack_from
+_unpack_long = struct.Struct('<Q').unpack_from
 
 
-def consume_int(buffer):
-    result = int.from_bytes(buffer[:4], 'little')
-    del buffer[:4]
-    return result
+def read_byte(buffer, offset):
+    return buffer[offset], offset + 1
 
 
-def consume_long(buffer):
-    result = int.from_bytes(buffer[:8], 'little')
-    del buffer[:8]
-    return result
+def read_short(buffer, offset):
+    return _unpack_short(buffer, offset)[0], offset + 2
 
 
-def consume_uleb128(buffer):
+def read_int(buffer, offset):
+    return _unpack_int(buffer, offset)[0], offset + 4
+
+
+def read_long(buffer, offset):
+    return _unpack_long(buffer, offset)[0], offset + 8
+
+
+def read_uleb128(buffer, offset):
+    # unrolled paths for one to three byte values, which covers every string
+    # length below 2 ** 21
+    byte = buffer[offset]
+    if byte < 0x80:
+        return byte, offset + 1
+    result = byte & 0x7f
+    byte = buffer[offset + 1]
+    if byte < 0x80:
+        return result | (byte << 7), offset + 2
+    result |= (byte & 0x7f) << 7
+    byte = buffer[offset + 2]
+    if byte < 0x80:
+        return result | (byte << 14), offset + 3
+
     result = 0
     shift = 0
     while True:
-        byte = consume_byte(buffer)
+        byte = buffer[offset]
+        offset += 1
         result |= (byte & 0x7f) << shift
         if (byte & 0x80) == 0:
             break
         shift += 7
 
-    return result
+    return result, offset
 
 
-def consume_string(buffer):
-    mode = consume_byte(buffer)
+def read_string(buffer, offset):
+    mode = buffer[offset]
+    offset += 1
     if mode == 0:
-        return None
+        return None, offset
     if mode != 0x0b:
         raise ValueError(
             f'unknown string start byte: {hex(mode)}, expected 0 or 0x0b',
         )
-    byte_length = consume_uleb128(buffer)
-    data = buffer[:byte_length]
-    del buffer[:byte_length]
-    return data.decode('utf-8')
+    byte_length, offset = read_uleb128(buffer, offset)
+    end = offset + byte_length
+    # ``str`` decodes straight out of the buffer without first copying the
+    # payload into an intermediate ``bytes`` object
+    return str(buffer[offset:end], 'utf-8'), end
 
 
-_windows_epoch = datetime.datetime(1, 1, 1)
+def read_datetime(buffer, offset):
+    windows_ticks, offset = read_long(buffer, offset)
+    return datetime_from_ticks(windows_ticks), offset
+
+
+# consume_* helper functions to read osu! binary files. These read a field from
+# the front of a bytearray and delete it, which moves the rest of the buffer on
+# every call; parsers should use the read_* functions above instead.
+
+def _consumer(read):
+    def consume(buffer):
+        result, offset = read(buffer, 0)
+        del buffer[:offset]
+        return result
+
+    consume.__name__ = read.__name__.replace('read', 'consume', 1)
+    return consume
 
 
-def consume_datetime(buffer):
-    windows_ticks = consume_long(buffer)
-    return _windows_epoch + datetime.timedelta(microseconds=windows_ticks / 10)
+consume_byte = _consumer(read_byte)
+consume_short = _consumer(read_short)
+consume_int = _consumer(read_int)
+consume_long = _consumer(read_long)
+consume_uleb128 = _consumer(read_uleb128)
+consume_string = _consumer(read_string)
+consume_datetime = _consumer(read_datetime)